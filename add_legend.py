@@ -5,9 +5,9 @@ Displays the color classifications on the left side of the image.
 """
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 
 
 # Color definitions (matching bonap_processor.py)
@@ -16,60 +16,79 @@ NON_NATIVE_COLOR = (139, 69, 19)  # Saddle brown
 NOXIOUS_COLOR = (139, 69, 19)     # Saddle brown (same as non-native)
 NOT_PRESENT_COLOR = (173, 142, 0)  # Olive/mustard
 
+# Legend entries, top to bottom
+LEGEND_ITEMS = [
+    ("Native", NATIVE_COLOR),
+    ("Non-Native", NOT_PRESENT_COLOR),
+    ("Noxious", NON_NATIVE_COLOR),
+]
 
-def add_legend_to_map(
-    input_path: Path,
-    output_path: Optional[Path] = None,
-    legend_width: int = 150,
-    background_color: Tuple[int, int, int] = (255, 255, 255)
-) -> Path:
+
+def _resolve_font(font_size: int) -> ImageFont.ImageFont:
     """
-    Add a legend to a processed BONAP map.
+    Load a TrueType font from common system locations.
 
     Args:
-        input_path: Path to the processed BONAP map image
-        output_path: Path for the output image. If None, adds '_with_legend' to filename
-        legend_width: Width of the legend area in pixels
-        background_color: RGB color for legend background
+        font_size: Font size in points
 
     Returns:
-        Path to the image with legend
+        The first available system font, or Pillow's default font
     """
-    # Ensure input_path is a Path object
-    input_path = Path(input_path)
-
-    # Load the processed map
-    map_img = Image.open(input_path)
-    map_width, map_height = map_img.size
-
-    # Create new image with space for legend on the left
-    total_width = legend_width + map_width
-    new_img = Image.new('RGB', (total_width, map_height), background_color)
-
-    # Paste the map on the right side
-    new_img.paste(map_img, (legend_width, 0))
-
-    # Draw legend on the left side
-    draw = ImageDraw.Draw(new_img)
-
     # Try to use a better font, fall back to default if not available
     try:
         # Try common font locations
-        font_size = 14
         font_paths = [
             "/System/Library/Fonts/Helvetica.ttc",  # macOS
             "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
             "C:\\Windows\\Fonts\\arial.ttf",  # Windows
         ]
-        font = None
         for font_path in font_paths:
             if Path(font_path).exists():
-                font = ImageFont.truetype(font_path, font_size)
-                break
-        if font is None:
-            font = ImageFont.load_default()
+                return ImageFont.truetype(font_path, font_size)
+        return ImageFont.load_default()
     except Exception:
-        font = ImageFont.load_default()
+        return ImageFont.load_default()
+
+
+# Resolve the legend font once per process rather than once per map
+_FONT = _resolve_font(14)
+
+
+def add_legend_to_image(
+    map_img: Union[Image.Image, np.ndarray],
+    output_path: Path,
+    legend_width: int = 150,
+    background_color: Tuple[int, int, int] = (255, 255, 255),
+    font: ImageFont.ImageFont = _FONT
+) -> Path:
+    """
+    Add a legend to an in-memory processed BONAP map.
+
+    Pairs with bonap_processor.remap_bonap_image() to skip saving and
+    re-decoding the processed map.
+
+    Args:
+        map_img: Processed map as a PIL image or an RGB array
+        output_path: Path for the output image
+        legend_width: Width of the legend area in pixels
+        background_color: RGB color for legend background
+        font: Font for the legend text. Defaults to a system font resolved at import
+
+    Returns:
+        Path to the image with legend
+    """
+    if isinstance(map_img, np.ndarray):
+        map_img = Image.fromarray(map_img)
+
+    # Palette-mode maps are drawn on as RGB
+    if map_img.mode != 'RGB':
+        map_img = map_img.convert('RGB')
+
+    # Grow the canvas on the left for the legend, with the map on the right
+    new_img = ImageOps.expand(map_img, border=(legend_width, 0, 0, 0), fill=background_color)
+
+    # Draw legend on the left side
+    draw = ImageDraw.Draw(new_img)
 
     # Calculate vertical spacing
     color_box_size = 20
@@ -82,14 +101,8 @@ def add_legend_to_map(
     draw.text((padding, 10), title_text, fill=(0, 0, 0), font=font)
 
     # Draw legend items
-    legend_items = [
-        ("Native", NATIVE_COLOR),
-        ("Non-Native", NOT_PRESENT_COLOR),
-        ("Noxious", NON_NATIVE_COLOR),
-    ]
-
     y_position = start_y
-    for label, color in legend_items:
+    for label, color in LEGEND_ITEMS:
         # Draw color box
         box_x1 = padding
         box_y1 = y_position
@@ -106,18 +119,47 @@ def add_legend_to_map(
 
         y_position += line_height
 
+    # Save the image
+    new_img.save(output_path)
+
+    print(f"✓ Added legend to: {output_path}")
+
+    return output_path
+
+
+def add_legend_to_map(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    legend_width: int = 150,
+    background_color: Tuple[int, int, int] = (255, 255, 255),
+    font: ImageFont.ImageFont = _FONT
+) -> Path:
+    """
+    Add a legend to a processed BONAP map.
+
+    Args:
+        input_path: Path to the processed BONAP map image
+        output_path: Path for the output image. If None, adds '_with_legend' to filename
+        legend_width: Width of the legend area in pixels
+        background_color: RGB color for legend background
+        font: Font for the legend text. Defaults to a system font resolved at import
+
+    Returns:
+        Path to the image with legend
+    """
+    # Ensure input_path is a Path object
+    input_path = Path(input_path)
+
     # Determine output path
     if output_path is None:
         stem = input_path.stem
         suffix = input_path.suffix
         output_path = input_path.parent / f"{stem}_with_legend{suffix}"
 
-    # Save the image
-    new_img.save(output_path)
-
-    print(f"✓ Added legend to: {output_path}")
+    # Load the processed map
+    map_img = Image.open(input_path)
 
-    return output_path
+    return add_legend_to_image(map_img, output_path, legend_width, background_color, font)
 
 
 def add_legend_to_processed_map(
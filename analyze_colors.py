@@ -3,9 +3,39 @@
 
 import numpy as np
 from PIL import Image
-from collections import Counter
 from pathlib import Path
 
+from bonap_processor import pack_rgb
+
+
+# Above this many pixels a dense 2**24-bin histogram beats sorting with np.unique
+BINCOUNT_MIN_PIXELS = 1 << 20
+
+
+def most_common_colors(rgb_array, n):
+    """Return the n most common colors as a list of ((r, g, b), count) pairs."""
+    packed = pack_rgb(rgb_array).ravel()
+
+    if packed.size > BINCOUNT_MIN_PIXELS:
+        # One pass over the image into a bin per 24-bit color, then pick the
+        # top bins without sorting the whole histogram
+        counts = np.bincount(packed, minlength=1 << 24)
+        codes = np.argpartition(counts, -n)[-n:]
+        codes = codes[counts[codes] > 0]
+        counts = counts[codes]
+    else:
+        # Small images: sort only the pixels instead of allocating 16M bins
+        codes, counts = np.unique(packed, return_counts=True)
+
+    # Most frequent first, ties broken by color code
+    top = np.lexsort((codes, -counts))[:n]
+
+    return [
+        ((int(code >> 16), int((code >> 8) & 0xFF), int(code & 0xFF)), int(count))
+        for code, count in zip(codes[top], counts[top])
+    ]
+
+
 def analyze_bonap_colors(image_path):
     """Analyze and display the most common colors in a BONAP map."""
     img = Image.open(image_path)
@@ -17,23 +47,19 @@ def analyze_bonap_colors(image_path):
     else:
         rgb_array = img_array
 
-    # Reshape to list of RGB tuples
     height, width = rgb_array.shape[:2]
-    pixels = rgb_array.reshape(-1, 3)
-
-    # Convert to list of tuples
-    pixel_tuples = [tuple(p) for p in pixels]
+    total_pixels = height * width
 
     # Count occurrences
-    color_counts = Counter(pixel_tuples)
+    color_counts = most_common_colors(rgb_array, 20)
 
     # Get most common colors
     print(f"\nAnalyzing: {image_path}")
     print(f"Image size: {width}x{height}")
     print(f"\nTop 20 most common colors (RGB):\n")
 
-    for i, (color, count) in enumerate(color_counts.most_common(20), 1):
-        percentage = (count / len(pixel_tuples)) * 100
+    for i, (color, count) in enumerate(color_counts, 1):
+        percentage = (count / total_pixels) * 100
         print(f"{i:2d}. RGB{color} - {count:6d} pixels ({percentage:5.2f}%)")
 
     return color_counts
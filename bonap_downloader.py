@@ -6,7 +6,11 @@ Biota of North America Program (BONAP) website.
 """
 
 import os
+import shutil
+import tempfile
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 from urllib.parse import quote
@@ -28,6 +32,9 @@ class BONAPDownloader:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Reuse one keep-alive connection pool for every request to bonap.net
+        self.session = requests.Session()
+
     def download_species_map(
         self,
         genus: str,
@@ -75,12 +82,26 @@ class BONAPDownloader:
         print(f"Downloading map for {species_name}...")
         print(f"URL: {image_url}")
 
-        response = requests.get(image_url, timeout=30)
-        response.raise_for_status()
-
-        # Save the image
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the image straight to disk instead of buffering it in memory
+        with self.session.get(image_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Undo any gzip transfer encoding
+
+            # Write to a uniquely named temporary file and only move it into
+            # place once the body is complete, so an interrupted download never
+            # leaves a truncated map at output_path and concurrent writers of
+            # the same map never share a temp file
+            fd, part_path = tempfile.mkstemp(
+                dir=output_path.parent, prefix=output_path.name, suffix='.part'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 16)
+                os.chmod(part_path, 0o644)  # mkstemp creates owner-only files
+                os.replace(part_path, output_path)
+            except BaseException:
+                Path(part_path).unlink(missing_ok=True)
+                raise
 
         print(f"✓ Map saved to: {output_path}")
 
@@ -94,27 +115,88 @@ class BONAPDownloader:
 
     def download_multiple_species(
         self,
-        species_list: list[tuple[str, str]]
+        species_list: list[tuple[str, str]],
+        max_workers: int = 8,
+        process_workers: int = 0
     ) -> dict[str, Path]:
         """
         Download maps for multiple species.
 
+        Downloads run concurrently on a thread pool. Each finished download is
+        handed to a single color-processing worker thread so network I/O and
+        image processing overlap. With process_workers > 0, finished downloads
+        are instead handed to a process pool so image processing runs across
+        CPU cores. Worker processes re-import the calling script on macOS,
+        Windows and newer Linux Pythons, so it must guard its entry point
+        with ``if __name__ == "__main__":``.
+
         Args:
             species_list: List of (genus, species) tuples
+            max_workers: Maximum number of concurrent downloads
+            process_workers: Number of color-processing processes.
+                           If 0, uses a single worker thread
 
         Returns:
             Dictionary mapping species names to downloaded file paths
         """
-        results = {}
-
+        from bonap_processor import remap_bonap_colors
+
+        # Preserve input order; failed species stay None
+        results = {f"{genus} {species}": None for genus, species in species_list}
+
+        # Keep a pooled connection per download thread so keep-alive reuse
+        # isn't lost once max_workers exceeds requests' default pool size
+        self.session.mount(
+            "https://", HTTPAdapter(pool_maxsize=max(max_workers, DEFAULT_POOLSIZE))
+        )
+
+        # Color processing runs off the download threads: on a process pool
+        # when requested (each worker builds the color lookup table once on
+        # import), otherwise on a single worker thread
+        if process_workers > 0:
+            process_pool = ProcessPoolExecutor(max_workers=process_workers)
+        else:
+            process_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Entries that canonicalize to the same map (e.g. differing only in
+        # case) would write the same file, so download each map once and
+        # share the result between their keys
+        map_keys = {}
         for genus, species in species_list:
-            try:
-                species_key = f"{genus} {species}"
-                path = self.download_species_map(genus, species)
-                results[species_key] = path
-            except Exception as e:
-                print(f"✗ Failed to download {genus} {species}: {e}")
-                results[species_key] = None
+            if genus and species:
+                canonical = (genus.strip().capitalize(), species.strip().lower())
+            else:
+                canonical = (genus, species)  # Rejected by download_species_map
+            map_keys.setdefault(canonical, []).append(f"{genus} {species}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as download_pool, process_pool:
+            downloads = {
+                download_pool.submit(
+                    self.download_species_map, genus, species, process_colors=False
+                ): species_keys
+                for (genus, species), species_keys in map_keys.items()
+            }
+
+            processing = {}
+            for future in as_completed(downloads):
+                species_keys = downloads[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    print(f"✗ Failed to download {species_keys[0]}: {e}")
+                    continue
+                processing[process_pool.submit(remap_bonap_colors, path)] = species_keys
+
+            for future in as_completed(processing):
+                species_keys = processing[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    print(f"✗ Failed to process {species_keys[0]}: {e}")
+                    continue
+
+                for species_key in species_keys:
+                    results[species_key] = path
 
         return results
 
@@ -5,6 +5,8 @@ This module provides utilities to process BONAP distribution maps,
 simplifying the color scheme to make native vs. exotic status clearer.
 """
 
+import functools
+import math
 from pathlib import Path
 from typing import Optional, Tuple
 import numpy as np
@@ -15,29 +17,49 @@ from PIL import Image
 # Based on official BONAP color key at bonap.org/MapKey.html
 
 # These colors indicate NATIVE status (species naturally occurs in this region)
+# Ordered by how often they appear on sample maps so per-pixel searches exit early
 NATIVE_COLORS = [
     (0, 128, 0),      # Dark green - species present and native
     (255, 255, 0),    # Yellow - species present and rare (native but rare)
     (255, 165, 0),    # Orange - species extirpated/historic (was native)
-    (0, 255, 0),      # Light/bright green - species present and not rare
     (0, 221, 145),    # Cyan/turquoise - species native but adventive in state (still native)
     (0, 165, 108),    # Teal - questionable presence / adventive variant (treat as native)
+    (0, 255, 0),      # Light/bright green - species present and not rare
 ]
 
 # Colors to leave unchanged (neither native nor exotic - species not present)
 # (173, 142, 0) - Olive/mustard - species NOT present in state
 
 # These colors indicate EXOTIC/NON-NATIVE status (human-introduced, not native to region)
+# Ordered by how often they appear on sample maps
 EXOTIC_COLORS = [
     (255, 0, 255),    # Magenta - species noxious (truly exotic)
     (0, 0, 255),      # Blue - species present and exotic
     (135, 206, 235),  # Sky blue - species waif
 ]
 
+# Palettes as arrays for the vectorized and compiled paths
+NATIVE_PALETTE_ARR = np.array(NATIVE_COLORS, dtype=np.int16)
+EXOTIC_PALETTE_ARR = np.array(EXOTIC_COLORS, dtype=np.int16)
+
 # Target colors for remapping
 TARGET_NATIVE_COLOR = (34, 139, 34)    # Forest green
 TARGET_EXOTIC_COLOR = (139, 69, 19)    # Saddle brown
 
+# Codes stored in the packed-RGB lookup table
+LUT_UNMATCHED = 0
+LUT_NATIVE = 1
+LUT_EXOTIC = 2
+
+
+def _dist2(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> int:
+    """Squared Euclidean distance between two RGB colors."""
+    # int() keeps uint8 pixel values from wrapping around on subtraction
+    d0 = int(color1[0]) - int(color2[0])
+    d1 = int(color1[1]) - int(color2[1])
+    d2 = int(color1[2]) - int(color2[2])
+    return d0 * d0 + d1 * d1 + d2 * d2
+
 
 def color_distance(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> float:
     """
@@ -50,7 +72,7 @@ def color_distance(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -
     Returns:
         Distance between the two colors
     """
-    return np.sqrt(sum((int(c1) - int(c2)) ** 2 for c1, c2 in zip(color1, color2)))
+    return math.sqrt(_dist2(color1, color2))
 
 
 def is_native_color(pixel: Tuple[int, int, int], threshold: float = 5.0) -> Optional[bool]:
@@ -64,74 +86,152 @@ def is_native_color(pixel: Tuple[int, int, int], threshold: float = 5.0) -> Opti
     Returns:
         True if native, False if exotic, None if neither (e.g., background/text)
     """
+    # Compare squared distances to skip the square root
+    threshold2 = threshold * threshold
+
     # Check if it's close to any native color
     for native_color in NATIVE_COLORS:
-        if color_distance(pixel, native_color) < threshold:
+        if _dist2(pixel, native_color) < threshold2:
             return True
 
     # Check if it's close to any exotic color
     for exotic_color in EXOTIC_COLORS:
-        if color_distance(pixel, exotic_color) < threshold:
+        if _dist2(pixel, exotic_color) < threshold2:
             return False
 
     # Not close to any defined color (probably background, text, or border)
     return None
 
 
-def remap_bonap_colors(
-    input_path: Path,
-    output_path: Optional[Path] = None,
-    native_color: Tuple[int, int, int] = TARGET_NATIVE_COLOR,
-    exotic_color: Tuple[int, int, int] = TARGET_EXOTIC_COLOR,
-    threshold: float = 5.0
-) -> Path:
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
     """
-    Remap BONAP map colors to a simpler native (green) vs exotic (brown) scheme.
+    Pack the last (R, G, B) axis of an array into 24-bit integer keys.
 
     Args:
-        input_path: Path to the input BONAP map image
-        output_path: Path for the output image. If None, adds '_processed' to filename
-        native_color: RGB color to use for native status
-        exotic_color: RGB color to use for exotic status
-        threshold: Color distance threshold for matching
+        rgb: Array whose last axis holds at least the R, G and B channels
 
     Returns:
-        Path to the processed image
+        uint32 array of (r << 16) | (g << 8) | b keys
     """
-    # Ensure input_path is a Path object
-    input_path = Path(input_path)
+    return (
+        (rgb[..., 0].astype(np.uint32) << 16)
+        | (rgb[..., 1].astype(np.uint32) << 8)
+        | rgb[..., 2].astype(np.uint32)
+    )
 
-    # Load image
-    img = Image.open(input_path)
-    img_array = np.array(img)
 
-    # Create output array
-    output_array = img_array.copy()
+@functools.lru_cache(maxsize=2)
+def build_color_lut(threshold: float = 5.0) -> np.ndarray:
+    """
+    Build a lookup table classifying every 24-bit RGB value.
 
-    # Process each pixel
-    height, width = img_array.shape[:2]
-    pixels_processed = 0
-    native_count = 0
-    exotic_count = 0
+    Each palette color is expanded to all neighbors within the threshold
+    distance, so a single gather gives the same answer as is_native_color().
+    Neighbors are generated one red slice at a time and clipped to 0..255,
+    so beyond the 16 MB table, working memory is bounded by a single
+    256x256 green/blue plane whatever the threshold.
+
+    Args:
+        threshold: Maximum color distance to consider a match
 
-    for y in range(height):
-        for x in range(width):
-            pixel = tuple(img_array[y, x][:3])  # Get RGB, ignore alpha if present
+    Returns:
+        uint8 array of length 2**24 holding LUT_NATIVE, LUT_EXOTIC or LUT_UNMATCHED
+    """
+    lut = np.zeros(1 << 24, dtype=np.uint8)
 
-            status = is_native_color(pixel, threshold)
+    threshold2 = threshold * threshold
+    radius = int(np.ceil(threshold))
 
-            if status is True:  # Native
-                output_array[y, x][:3] = native_color
-                native_count += 1
-                pixels_processed += 1
-            elif status is False:  # Exotic
-                output_array[y, x][:3] = exotic_color
-                exotic_count += 1
-                pixels_processed += 1
-            # If None, leave the pixel unchanged (background, text, borders)
+    # Exotic first so native colors win where the two neighborhoods overlap
+    for code, palette in ((LUT_EXOTIC, EXOTIC_PALETTE_ARR), (LUT_NATIVE, NATIVE_PALETTE_ARR)):
+        for r0, g0, b0 in palette.tolist():
+            # Green/blue plane around the color, clipped to the valid range
+            g = np.arange(max(0, g0 - radius), min(255, g0 + radius) + 1)
+            b = np.arange(max(0, b0 - radius), min(255, b0 + radius) + 1)
+            gb_dist2 = (g[:, None] - g0) ** 2 + (b[None, :] - b0) ** 2
+            gb_keys = (g[:, None] << 8) | b[None, :]
 
-    # Note: Diagonal hatching removal disabled - minimal visual impact and avoids processing time
+            for r in range(max(0, r0 - radius), min(255, r0 + radius) + 1):
+                in_range = gb_dist2 < threshold2 - (r - r0) ** 2
+                lut[(r << 16) | gb_keys[in_range]] = code
 
+    return lut
+
+
+# Build the table for the default threshold once at import
+build_color_lut(5.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_classify_kernel():
+    """
+    Import numba and compile the pixel classification kernel on first use.
+
+    numba is optional, so it is only imported when use_numba=True is requested.
+
+    Returns:
+        Compiled kernel filling codes with LUT_* values for each pixel
+
+    Raises:
+        ImportError: If numba is not installed
+    """
+    try:
+        import numba
+        from numba import njit, prange
+    except ImportError as e:
+        raise ImportError("use_numba=True requires the numba package") from e
+
+    # Only pick a threading layer if the application hasn't chosen one
+    if numba.config.THREADING_LAYER == 'default':
+        numba.config.THREADING_LAYER = 'workqueue'
+
+    @njit(parallel=True, cache=True)
+    def _classify_kernel(arr, native_palette, exotic_palette, threshold2, codes):
+        """Fill codes with LUT_* values for each pixel, rows in parallel."""
+        height, width = arr.shape[0], arr.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                r = np.int32(arr[y, x, 0])
+                g = np.int32(arr[y, x, 1])
+                b = np.int32(arr[y, x, 2])
+                code = LUT_UNMATCHED
+
+                for i in range(native_palette.shape[0]):
+                    d0 = r - native_palette[i, 0]
+                    d1 = g - native_palette[i, 1]
+                    d2 = b - native_palette[i, 2]
+                    if d0 * d0 + d1 * d1 + d2 * d2 < threshold2:
+                        code = LUT_NATIVE
+                        break
+
+                if code == LUT_UNMATCHED:
+                    for i in range(exotic_palette.shape[0]):
+                        d0 = r - exotic_palette[i, 0]
+                        d1 = g - exotic_palette[i, 1]
+                        d2 = b - exotic_palette[i, 2]
+                        if d0 * d0 + d1 * d1 + d2 * d2 < threshold2:
+                            code = LUT_EXOTIC
+                            break
+
+                codes[y, x] = code
+
+    return _classify_kernel
+
+
+@functools.lru_cache(maxsize=8)
+def _crop_box(width: int, height: int) -> Tuple[int, int, int, int]:
+    """
+    Compute the continental US crop box for a map of the given size.
+
+    BONAP maps share a handful of sizes, so the box is cached per shape.
+
+    Args:
+        width: Map width in pixels
+        height: Map height in pixels
+
+    Returns:
+        (left, top, right, bottom) box for Image.crop
+    """
     # Crop to focus on continental US area (removes most of Canada, Alaska, and ocean)
     # Based on the pink box in the reference image, crop to the continental US
     # - Top: Just above US-Canada border (around 50% down)
@@ -143,8 +243,199 @@ def remap_bonap_colors(
     crop_left = int(width * 0.33)  # Start at west coast (cropped 10% more)
     crop_right = int(width * 0.73)  # End at east coast (cropped 10% more)
 
-    output_array = output_array[crop_top:crop_bottom, crop_left:crop_right]
-    print(f"✓ Cropped to {output_array.shape[1]}x{output_array.shape[0]} (focused on continental US)")
+    return crop_left, crop_top, crop_right, crop_bottom
+
+
+def _remap_palette_image(
+    img: Image.Image,
+    native_color: Tuple[int, int, int],
+    exotic_color: Tuple[int, int, int],
+    threshold: float
+) -> Tuple[Image.Image, int, int]:
+    """
+    Remap a palette-mode ('P') image by rewriting its palette in place.
+
+    Args:
+        img: Palette-mode image to remap
+        native_color: RGB color to use for native status
+        exotic_color: RGB color to use for exotic status
+        threshold: Color distance threshold for matching
+
+    Returns:
+        Tuple of (remapped image, native pixel count, exotic pixel count)
+    """
+    palette = img.getpalette()
+    entry_counts = np.bincount(np.asarray(img).ravel(), minlength=len(palette) // 3)
+    native_count = 0
+    exotic_count = 0
+
+    # At most 256 entries, so classify each one in Python
+    for i in range(len(palette) // 3):
+        status = is_native_color(palette[3 * i:3 * i + 3], threshold)
+
+        if status is True:  # Native
+            palette[3 * i:3 * i + 3] = native_color
+            native_count += int(entry_counts[i])
+        elif status is False:  # Exotic
+            palette[3 * i:3 * i + 3] = exotic_color
+            exotic_count += int(entry_counts[i])
+        # If None, leave the entry unchanged (background, text, borders)
+
+    img.putpalette(palette)
+    return img, native_count, exotic_count
+
+
+def _remap_rgb_image(
+    img: Image.Image,
+    native_color: Tuple[int, int, int],
+    exotic_color: Tuple[int, int, int],
+    threshold: float,
+    use_numba: bool = False
+) -> Tuple[Image.Image, int, int]:
+    """
+    Remap any non-palette image pixel by pixel.
+
+    Args:
+        img: Image to remap; any alpha channel is dropped
+        native_color: RGB color to use for native status
+        exotic_color: RGB color to use for exotic status
+        threshold: Color distance threshold for matching
+        use_numba: If True, classify pixels with the compiled Numba kernel
+
+    Returns:
+        Tuple of (remapped image, native pixel count, exotic pixel count)
+    """
+    # View the RGB pixels without copying
+    img_array = np.asarray(img.convert('RGB'))
+
+    if use_numba:
+        # Classify every pixel by palette distance in compiled code
+        codes = np.empty(img_array.shape[:2], dtype=np.uint8)
+        _load_classify_kernel()(
+            img_array,
+            NATIVE_PALETTE_ARR,
+            EXOTIC_PALETTE_ARR,
+            float(threshold) ** 2,
+            codes,
+        )
+    else:
+        # Classify every pixel with a single lookup on its packed RGB value
+        codes = build_color_lut(threshold)[pack_rgb(img_array)]
+    native_mask = codes == LUT_NATIVE
+    exotic_mask = codes == LUT_EXOTIC
+
+    # Build the output in one allocation; pixels in neither mask are left
+    # unchanged (background, text, borders)
+    output_array = np.where(exotic_mask[..., None], np.array(exotic_color, dtype=np.uint8), img_array)
+    output_array[native_mask] = native_color
+
+    out_height, out_width = output_array.shape[:2]
+    output_img = Image.frombuffer('RGB', (out_width, out_height),
+                                  output_array, 'raw', 'RGB', 0, 1)
+
+    # The remapped map has only a handful of distinct colors, so store it
+    # losslessly as a palette image (1 byte per pixel). getcolors() finds the
+    # colors in C and returns None if there are more than 256
+    colors = output_img.getcolors(256)
+    if colors is not None:
+        palette = np.array(sorted(color for _, color in colors), dtype=np.uint8)
+        indices = np.searchsorted(pack_rgb(palette), pack_rgb(output_array)).astype(np.uint8)
+        output_img = Image.frombuffer('P', (out_width, out_height), indices, 'raw', 'P', 0, 1)
+        output_img.putpalette(palette.tobytes())
+
+    return output_img, int(native_mask.sum()), int(exotic_mask.sum())
+
+
+def remap_bonap_image(
+    input_path: Path,
+    native_color: Tuple[int, int, int] = TARGET_NATIVE_COLOR,
+    exotic_color: Tuple[int, int, int] = TARGET_EXOTIC_COLOR,
+    threshold: float = 5.0,
+    use_numba: bool = False
+) -> Image.Image:
+    """
+    Crop and remap a BONAP map in memory without saving it.
+
+    Use this instead of remap_bonap_colors() when the result is consumed in
+    the same process (e.g. by add_legend.add_legend_to_image) to avoid
+    writing and re-decoding the PNG.
+
+    Args:
+        input_path: Path to the input BONAP map image
+        native_color: RGB color to use for native status
+        exotic_color: RGB color to use for exotic status
+        threshold: Color distance threshold for matching
+        use_numba: If True, classify pixels with a compiled Numba kernel instead
+                   of the lookup table (requires numba). Useful when the color
+                   tables or threshold make the lookup table expensive to build.
+                   Ignored for palette-mode images, which are remapped by
+                   rewriting their palette
+
+    Returns:
+        The processed image
+
+    Raises:
+        ImportError: If use_numba is True and numba is not installed
+    """
+    if use_numba:
+        # Fail before doing any work if numba is missing
+        _load_classify_kernel()
+
+    # Load image
+    img = Image.open(input_path)
+
+    # Crop before remapping so only the kept region is ever classified
+    img = img.crop(_crop_box(img.width, img.height))
+    print(f"✓ Cropped to {img.width}x{img.height} (focused on continental US)")
+
+    if img.mode == 'P':
+        # Palette image: remap the palette entries instead of the pixels
+        output_img, native_count, exotic_count = _remap_palette_image(
+            img, native_color, exotic_color, threshold
+        )
+    else:
+        output_img, native_count, exotic_count = _remap_rgb_image(
+            img, native_color, exotic_color, threshold, use_numba
+        )
+    pixels_processed = native_count + exotic_count
+
+    # Note: Diagonal hatching removal disabled - minimal visual impact and avoids processing time
+
+    print(f"✓ Processed {pixels_processed} pixels ({native_count} native, {exotic_count} exotic)")
+
+    return output_img
+
+
+def remap_bonap_colors(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    native_color: Tuple[int, int, int] = TARGET_NATIVE_COLOR,
+    exotic_color: Tuple[int, int, int] = TARGET_EXOTIC_COLOR,
+    threshold: float = 5.0,
+    use_numba: bool = False
+) -> Path:
+    """
+    Remap BONAP map colors to a simpler native (green) vs exotic (brown) scheme.
+
+    Args:
+        input_path: Path to the input BONAP map image
+        output_path: Path for the output image. If None, adds '_processed' to filename
+        native_color: RGB color to use for native status
+        exotic_color: RGB color to use for exotic status
+        threshold: Color distance threshold for matching
+        use_numba: If True, classify pixels with a compiled Numba kernel
+                   (requires numba). See remap_bonap_image()
+
+    Returns:
+        Path to the processed image
+
+    Raises:
+        ImportError: If use_numba is True and numba is not installed
+    """
+    # Ensure input_path is a Path object
+    input_path = Path(input_path)
+
+    output_img = remap_bonap_image(input_path, native_color, exotic_color, threshold, use_numba)
 
     # Determine output path
     if output_path is None:
@@ -153,10 +444,8 @@ def remap_bonap_colors(
         output_path = input_path.parent / f"{stem}_processed{suffix}"
 
     # Save processed image
-    output_img = Image.fromarray(output_array)
-    output_img.save(output_path)
+    output_img.save(output_path, compress_level=6)
 
-    print(f"✓ Processed {pixels_processed} pixels ({native_count} native, {exotic_count} exotic)")
     print(f"✓ Saved to: {output_path}")
 
     return output_path
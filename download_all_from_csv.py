@@ -3,6 +3,8 @@
 Download BONAP maps for all species in the Shopify CSV export.
 """
 
+from pathlib import Path
+
 from bonap_downloader import BONAPDownloader
 from parse_scientific_names import parse_csv_scientific_names
 
@@ -14,17 +16,40 @@ def main():
     print("Parsing scientific names from CSV...")
     try:
         scientific_names = parse_csv_scientific_names(csv_file)
-        print(f"Found {len(scientific_names)} unique species\n")
     except Exception as e:
         print(f"Error parsing CSV: {e}")
         return
 
+    output_dir = Path("bonap_maps")
+
+    # Canonicalize names the way the downloader does, dropping case and
+    # whitespace variants of the same species
+    species_list = list(dict.fromkeys(
+        (genus.strip().capitalize(), species.strip().lower())
+        for genus, species in scientific_names
+    ))
+    print(f"Found {len(species_list)} unique species\n")
+
+    # Skip species whose processed map is already on disk so reruns only
+    # fetch new species
+    species_to_fetch = []
+    skipped = []
+    for genus, species in species_list:
+        processed_path = output_dir / f"{genus.lower()}_{species}_bonap_processed.png"
+        if processed_path.exists():
+            skipped.append(f"{genus} {species}")
+        else:
+            species_to_fetch.append((genus, species))
+
+    if skipped:
+        print(f"Skipping {len(skipped)} species already in {output_dir}/\n")
+
     # Initialize downloader
-    downloader = BONAPDownloader(output_dir="bonap_maps")
+    downloader = BONAPDownloader(output_dir=str(output_dir))
 
-    # Download maps for all species
+    # Download maps for all remaining species
     print("Downloading BONAP maps...\n")
-    results = downloader.download_multiple_species(scientific_names)
+    results = downloader.download_multiple_species(species_to_fetch)
 
     # Print summary
     print("\n" + "=" * 60)
@@ -34,8 +59,9 @@ def main():
     successful = sum(1 for path in results.values() if path is not None)
     failed = len(results) - successful
 
-    print(f"\nTotal species: {len(results)}")
+    print(f"\nTotal species: {len(species_list)}")
     print(f"✓ Successfully downloaded: {successful}")
+    print(f"- Skipped (already downloaded): {len(skipped)}")
     print(f"✗ Failed: {failed}")
 
     if failed > 0:
@@ -4,7 +4,8 @@ Example usage of the BONAP downloader utility.
 """
 
 from bonap_downloader import BONAPDownloader, download_plant_map
-from bonap_processor import process_bonap_map
+from bonap_processor import process_bonap_map, remap_bonap_image
+from add_legend import add_legend_to_image
 
 
 def example_single_download():
@@ -77,6 +78,22 @@ def example_custom_output():
     print(f"\nDownloaded to: {path}\n")
 
 
+def example_process_with_legend():
+    """Process a map and add a legend without re-reading the processed PNG."""
+    print("\n=== Example 6: Process and add legend in memory ===\n")
+
+    # Download the original map only
+    path = download_plant_map("Asclepias", "tuberosa", process_colors=False)
+
+    # Remap in memory and hand the image straight to the legend step
+    processed_img = remap_bonap_image(path)
+    legend_path = add_legend_to_image(
+        processed_img,
+        path.parent / "asclepias_tuberosa_bonap_processed_with_legend.png"
+    )
+    print(f"\nMap with legend saved to: {legend_path}\n")
+
+
 if __name__ == "__main__":
     # Run example 1: Download Asclepias tuberosa
     example_single_download()
@@ -86,3 +103,4 @@ if __name__ == "__main__":
     # example_process_existing()
     # example_multiple_downloads()
     # example_custom_output()
+    # example_process_with_legend()
@@ -3,17 +3,17 @@
 
 import numpy as np
 from PIL import Image
-from collections import Counter
+
+from analyze_colors import most_common_colors
 
 def find_state_colors(image_path):
     """Find colors that are likely state fills."""
     img = Image.open(image_path)
     arr = np.array(img)[:, :, :3]
 
-    # Get all pixels
-    pixels = arr.reshape(-1, 3)
-    pixel_tuples = [tuple(p) for p in pixels]
-    color_counts = Counter(pixel_tuples)
+    # Count colors across all pixels
+    total_pixels = arr.shape[0] * arr.shape[1]
+    color_counts = most_common_colors(arr, 30)
 
     # Background/border colors to ignore
     ignore_colors = {
@@ -25,9 +25,9 @@ def find_state_colors(image_path):
     }
 
     print("State/Province fill colors (excluding background/borders):\n")
-    for color, count in color_counts.most_common(30):
+    for color, count in color_counts:
         if color not in ignore_colors and count > 500:
-            percentage = (count / len(pixel_tuples)) * 100
+            percentage = (count / total_pixels) * 100
             print(f"RGB{color} - {count:6d} pixels ({percentage:5.2f}%)")
 
 if __name__ == "__main__":
@@ -10,6 +10,11 @@ from pathlib import Path
 from typing import List, Tuple
 
 
+# Match text between two dashes
+# Pattern: anything - (genus) (species) - anything
+_SCI_RE = re.compile(r'-\s*([A-Z][a-z]+)\s+([a-z]+)\s*-')
+
+
 def extract_scientific_name(title: str) -> str | None:
     """
     Extract scientific name from a title string.
@@ -23,13 +28,10 @@ def extract_scientific_name(title: str) -> str | None:
     Returns:
         Scientific name (genus species) or None
     """
-    # Match text between two dashes
-    # Pattern: anything - (scientific name) - anything
-    pattern = r'-\s*([A-Z][a-z]+\s+[a-z]+)\s*-'
-
-    match = re.search(pattern, title)
+    match = _SCI_RE.search(title)
     if match:
-        return match.group(1).strip()
+        # Join with a single space so callers can split on it directly
+        return f"{match.group(1)} {match.group(2)}"
 
     return None
 
@@ -49,14 +51,21 @@ def parse_csv_scientific_names(csv_path: str) -> List[Tuple[str, str]]:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    scientific_names = []
-    seen = set()  # Track duplicates
+    # Insertion-ordered dict doubles as the dedup set and the result list
+    seen: dict[tuple[str, str], None] = {}
 
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        # Only the Title column is needed, so index rows by position rather
+        # than building a dict per row
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        if 'Title' not in header:
+            return []
+        title_idx = header.index('Title')
 
         for row in reader:
-            title = row.get('Title', '')
+            title = row[title_idx] if title_idx < len(row) else ''
 
             if not title:
                 continue
@@ -65,17 +74,14 @@ def parse_csv_scientific_names(csv_path: str) -> List[Tuple[str, str]]:
 
             if scientific_name:
                 # Split into genus and species
-                parts = scientific_name.split()
+                parts = scientific_name.split(' ', 1)
                 if len(parts) == 2:
                     genus, species = parts
 
                     # Track unique names
-                    key = f"{genus} {species}"
-                    if key not in seen:
-                        scientific_names.append((genus, species))
-                        seen.add(key)
+                    seen.setdefault((genus, species), None)
 
-    return scientific_names
+    return list(seen)
 
 
 def main():